@@ -10,24 +10,59 @@ Gilson Almeida(https://github.com/gilsonfiho)
 
 """
 
-import cv2
-import numpy as np
 import os
-import math
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import subprocess
 import tempfile
-import shutil
 from tqdm import tqdm
-import threading
-import time
 
-from src.audio_utils import accelerate_chunk
+from src.audio_utils import build_atempo_filter
+
+# Tamanho de cada leitura direta (os.read) do pipe de progresso do FFmpeg
+READ_CHUNK_SIZE = 1 << 16
+
+# Tempo atual na saída de '-progress' do FFmpeg (ex.: b"out_time_us=83450000\n")
+FFMPEG_OUT_TIME_RE = re.compile(rb'out_time_us=(\d+)\r?\n')
+
+# Configurações de qualidade
+QUALITY_SETTINGS = {
+    'low': {'bitrate': '64k', 'sample_rate': '22050'},
+    'medium': {'bitrate': '128k', 'sample_rate': '44100'},
+    'high': {'bitrate': '192k', 'sample_rate': '44100'}
+}
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(path, mtime_ns, size):
+    """
+    Consulta a duração de um arquivo via FFprobe. O cache é indexado por
+    (caminho, mtime, tamanho), então um arquivo alterado é consultado de novo.
+    Falhas levantam exceção e por isso não ficam no cache.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        path
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+    return float(result.stdout.strip())
+
 
 class OpenCVAudioExtractor:
     def __init__(self, video_path):
         """
-        Extrator de áudio otimizado usando apenas OpenCV e FFmpeg
+        Extrator de áudio otimizado usando apenas FFmpeg/FFprobe
 
         Args:
             video_path (str): Caminho para o arquivo de vídeo
@@ -37,26 +72,48 @@ class OpenCVAudioExtractor:
 
     def get_video_info(self):
         """
-        Obtém informações do vídeo usando OpenCV
+        Obtém informações do vídeo usando FFprobe
 
         Returns:
             dict: Informações do vídeo
         """
+        # Já consultado: evita um novo FFprobe
+        if self.video_info:
+            return self.video_info
+
         try:
-            cap = cv2.VideoCapture(self.video_path)
+            cmd = [
+                'ffprobe',
+                '-v', 'error',
+                '-select_streams', 'v:0',
+                '-show_entries', 'stream=r_frame_rate,nb_frames,width,height:format=duration',
+                '-of', 'json',
+                self.video_path
+            ]
 
-            if not cap.isOpened():
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode != 0:
                 raise ValueError("Não foi possível abrir o arquivo de vídeo")
 
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            duration = frame_count / fps if fps > 0 else 0
+            probe = json.loads(result.stdout)
+            stream = (probe.get('streams') or [{}])[0]
 
-            # Obter dimensões
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            # r_frame_rate vem como fração, ex.: "30000/1001"
+            num, _, den = stream.get('r_frame_rate', '0/1').partition('/')
+            fps = float(num) / float(den) if den and float(den) > 0 else float(num or 0)
+            duration = float(probe.get('format', {}).get('duration', 0))
 
-            cap.release()
+            # nb_frames não existe em alguns containers (ex.: MKV)
+            nb_frames = stream.get('nb_frames')
+            if nb_frames and nb_frames.isdigit():
+                frame_count = int(nb_frames)
+            else:
+                frame_count = int(duration * fps)
+
+            # Obter dimensões
+            width = int(stream.get('width', 0))
+            height = int(stream.get('height', 0))
 
             self.video_info = {
                 'fps': fps,
@@ -98,14 +155,7 @@ class OpenCVAudioExtractor:
             video_name = Path(self.video_path).stem
             audio_path = os.path.join(output_dir, f"{video_name}.mp3")
 
-            # Configurações de qualidade
-            quality_settings = {
-                'low': {'bitrate': '64k', 'sample_rate': '22050'},
-                'medium': {'bitrate': '128k', 'sample_rate': '44100'},
-                'high': {'bitrate': '192k', 'sample_rate': '44100'}
-            }
-
-            settings = quality_settings.get(quality, quality_settings['medium'])
+            settings = QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS['medium'])
 
             # Comando FFmpeg otimizado para poucos recursos
             cmd = [
@@ -147,7 +197,7 @@ class OpenCVAudioExtractor:
             print(f"Erro na extração: {str(e)}")
             return None
 
-    def split_audio_chunks(self, audio_path, n_parts, output_dir="output"):
+    def split_audio_chunks(self, audio_path, n_parts, output_dir="output", duration=None):
         """
         Divide áudio MP3 em chunks usando FFmpeg
 
@@ -155,6 +205,7 @@ class OpenCVAudioExtractor:
             audio_path (str): Caminho do arquivo de áudio
             n_parts (int): Número de partes
             output_dir (str): Diretório de saída
+            duration (float): Duração do áudio, se já conhecida (evita nova consulta ao FFprobe)
 
         Returns:
             list: Lista de arquivos gerados
@@ -165,7 +216,8 @@ class OpenCVAudioExtractor:
                 return []
 
             # Obter duração do áudio
-            duration = self._get_audio_duration(audio_path)
+            if duration is None:
+                duration = self._get_audio_duration(audio_path)
             if duration <= 0:
                 print("Não foi possível obter a duração do áudio")
                 return []
@@ -173,53 +225,27 @@ class OpenCVAudioExtractor:
             # Calcular duração de cada parte
             chunk_duration = duration / n_parts
 
-            split_files = []
             base_name = Path(audio_path).stem
 
             print(f"Dividindo áudio em {n_parts} partes...")
             print(f"Duração total: {duration:.2f}s")
             print(f"Duração por parte: {chunk_duration:.2f}s")
 
-            # Barra de progresso para divisão
-            with tqdm(total=n_parts, desc="Dividindo áudio", unit="parte") as pbar:
-                for i in range(n_parts):
-                    start_time = i * chunk_duration
-
-                    # Última parte pega o resto
-                    if i == n_parts - 1:
-                        chunk_duration_actual = duration - start_time
-                    else:
-                        chunk_duration_actual = chunk_duration
-
-                    # Nome do arquivo da parte
-                    part_filename = f"{base_name}_parte_{i + 1:03d}.mp3"
-                    part_path = os.path.join(output_dir, part_filename)
-
-                    # Comando FFmpeg para dividir
-                    cmd = [
-                        'ffmpeg',
-                        '-i', audio_path,
-                        '-ss', str(start_time),
-                        '-t', str(chunk_duration_actual),
-                        '-acodec', 'copy',  # Copiar sem recodificar
-                        '-avoid_negative_ts', 'make_zero',
-                        '-loglevel', 'error',
-                        '-y',
-                        part_path
-                    ]
-
-                    # Executar comando
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode == 0 and os.path.exists(part_path):
-                        size_mb = os.path.getsize(part_path) / (1024 * 1024)
-                        split_files.append(part_path)
-                        pbar.set_postfix(arquivo=part_filename, tamanho=f"{size_mb:.2f}MB")
-                    else:
-                        pbar.set_postfix(erro=f"Falha na parte {i + 1}")
-                        print(f"Erro ao criar parte {i + 1}: {result.stderr}")
+            # Um único processo FFmpeg gera todas as partes com o segment muxer
+            output_pattern = os.path.join(output_dir, f"{base_name}_parte_%03d.mp3")
+            cmd = [
+                'ffmpeg',
+                '-i', audio_path,
+                '-map', '0:a',
+                '-c', 'copy',  # Copiar sem recodificar
+            ]
 
-                    pbar.update(1)
+            split_files = self._run_segment_muxer(cmd, output_pattern, duration, n_parts,
+                                                  "Dividindo áudio")
+
+            for part_path in split_files:
+                size_mb = os.path.getsize(part_path) / (1024 * 1024)
+                print(f"Parte criada: {os.path.basename(part_path)} ({size_mb:.2f}MB)")
 
             return split_files
 
@@ -227,31 +253,205 @@ class OpenCVAudioExtractor:
             print(f"Erro ao dividir áudio: {str(e)}")
             return []
 
-    def _get_audio_duration(self, audio_path):
+    def _run_segment_muxer(self, cmd, output_pattern, duration, n_parts, description):
         """
-        Obtém a duração do áudio usando FFprobe
+        Completa o comando FFmpeg com o segment muxer, executa e retorna as
+        partes que o próprio FFmpeg reportou ter escrito (via '-segment_list'),
+        ignorando arquivos antigos com o mesmo padrão no diretório de saída
 
         Args:
-            audio_path (str): Caminho do arquivo de áudio
+            cmd (list): Comando FFmpeg com entrada e opções de áudio (sem saída)
+            output_pattern (str): Padrão dos arquivos de saída (ex.: 'nome_parte_%03d.mp3')
+            duration (float): Duração total da saída em segundos
+            n_parts (int): Número de partes esperado
+            description (str): Descrição para a barra de progresso
 
         Returns:
-            float: Duração em segundos
+            list: Lista de arquivos gerados (vazia se falhar ou se o número de partes não bater)
         """
+        output_dir = os.path.dirname(output_pattern)
+        chunk_duration = duration / n_parts
+
+        # Pontos de corte explícitos: no máximo n_parts partes, sem sobra no final
+        cut_points = ','.join(str(i * chunk_duration) for i in range(1, n_parts))
+
+        fd, list_path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                audio_path
+            cmd = cmd + ['-f', 'segment']
+            if cut_points:
+                cmd += ['-segment_times', cut_points]
+            else:
+                cmd += ['-segment_time', str(duration + 1)]
+            cmd += [
+                '-segment_start_number', '1',
+                '-reset_timestamps', '1',
+                '-segment_list', list_path,
+                '-segment_list_type', 'flat',
+                '-loglevel', 'error',
+                '-y',
+                output_pattern
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run_ffmpeg_with_progress(cmd, duration, description)
 
-            if result.returncode == 0:
-                return float(result.stdout.strip())
-            else:
-                return 0.0
+            if result.returncode != 0:
+                print(f"Erro FFmpeg: {result.stderr}")
+                return []
+
+            with open(list_path, encoding='utf-8') as f:
+                split_files = [os.path.join(output_dir, os.path.basename(line.strip()))
+                               for line in f if line.strip()]
+
+        finally:
+            try:
+                os.remove(list_path)
+            except OSError:
+                pass
+
+        if len(split_files) != n_parts:
+            print(f"Erro: esperadas {n_parts} partes, FFmpeg gerou {len(split_files)}")
+            return []
+
+        return split_files
+
+    def extract_audio_chunks(self, n_parts, output_dir="output", quality="medium", speed=1.0,
+                             workers=1):
+        """
+        Extrai o áudio do vídeo e grava as partes MP3 diretamente, sem arquivo
+        MP3 intermediário. Com workers=1 usa uma única execução do FFmpeg;
+        com mais workers, codifica as partes em paralelo (um FFmpeg por parte)
+
+        Args:
+            n_parts (int): Número de partes
+            output_dir (str): Diretório de saída
+            quality (str): Qualidade do áudio ('low', 'medium', 'high')
+            speed (float): Fator de velocidade aplicado ao áudio
+            workers (int): Número de processos FFmpeg simultâneos
+
+        Returns:
+            list: Lista de arquivos gerados
+        """
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+
+            if not self.video_info:
+                self.get_video_info()
+
+            if not self.video_info or self.video_info['duration'] <= 0:
+                print("Não foi possível obter a duração do vídeo")
+                return []
+
+            settings = QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS['medium'])
+
+            video_name = Path(self.video_path).stem
+            if speed != 1.0:
+                video_name = f"{video_name}_speed_{speed:.2f}"
+
+            # Duração do áudio de saída (já considerando a velocidade)
+            duration = self.video_info['duration'] / speed
+            chunk_duration = duration / n_parts
+
+            audio_args = ['-vn']  # Sem vídeo
+            if speed != 1.0:
+                audio_args += ['-filter:a', build_atempo_filter(speed)]
+            audio_args += [
+                '-acodec', 'libmp3lame',  # Codec MP3
+                '-b:a', settings['bitrate'],  # Bitrate
+                '-ar', settings['sample_rate'],  # Sample rate
+                '-ac', '1',  # Mono para economizar espaço
+                '-threads', '1',  # Usar apenas 1 thread
+            ]
+
+            print(f"Extraindo e dividindo áudio: {Path(self.video_path).stem}")
+            print(f"Duração: {duration:.2f}s")
+            print(f"Qualidade: {quality} ({settings['bitrate']})")
+            print(f"Partes: {n_parts} ({chunk_duration:.2f}s cada)")
+
+            if workers > 1 and n_parts > 1:
+                return self._extract_chunks_parallel(audio_args, video_name, n_parts,
+                                                     output_dir, workers)
+
+            output_pattern = os.path.join(output_dir, f"{video_name}_parte_%03d.mp3")
+            cmd = ['ffmpeg', '-i', self.video_path] + audio_args
+
+            # O progresso do FFmpeg é reportado no tempo do áudio de saída
+            split_files = self._run_segment_muxer(cmd, output_pattern, duration, n_parts,
+                                                  "Extraindo áudio")
+
+            for part_path in split_files:
+                size_mb = os.path.getsize(part_path) / (1024 * 1024)
+                print(f"Parte criada: {os.path.basename(part_path)} ({size_mb:.2f}MB)")
+
+            return split_files
+
+        except Exception as e:
+            print(f"Erro na extração: {str(e)}")
+            return []
+
+    def _extract_chunks_parallel(self, audio_args, video_name, n_parts, output_dir, workers):
+        """
+        Codifica cada parte com um FFmpeg próprio, em paralelo. O '-ss' antes
+        do '-i' faz o seek na entrada, então cada processo lê só o seu trecho
+
+        Args:
+            audio_args (list): Argumentos de saída de áudio (filtro, codec, bitrate...)
+            video_name (str): Nome base dos arquivos de saída
+            n_parts (int): Número de partes
+            output_dir (str): Diretório de saída
+            workers (int): Número máximo de processos FFmpeg simultâneos
+
+        Returns:
+            list: Lista de arquivos gerados
+        """
+        # Trechos calculados no tempo do vídeo original (antes do atempo)
+        source_chunk = self.video_info['duration'] / n_parts
+
+        def run(i):
+            part_path = os.path.join(output_dir, f"{video_name}_parte_{i + 1:03d}.mp3")
+            cmd = ['ffmpeg', '-ss', str(i * source_chunk)]
+            # Última parte vai até o fim do vídeo
+            if i < n_parts - 1:
+                cmd += ['-t', str(source_chunk)]
+            cmd += ['-i', self.video_path] + audio_args + ['-loglevel', 'error', '-y', part_path]
+
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                print(f"Erro ao criar parte {i + 1}: {result.stderr.decode(errors='replace')}")
+                return None
+            return part_path
+
+        split_files = []
+        with ThreadPoolExecutor(max_workers=min(n_parts, workers)) as executor:
+            with tqdm(total=n_parts, desc="Extraindo áudio", unit="parte") as pbar:
+                for part_path in executor.map(run, range(n_parts)):
+                    if part_path and os.path.exists(part_path):
+                        size_mb = os.path.getsize(part_path) / (1024 * 1024)
+                        split_files.append(part_path)
+                        pbar.set_postfix(arquivo=os.path.basename(part_path),
+                                         tamanho=f"{size_mb:.2f}MB")
+                    pbar.update(1)
+
+        # Uma parte faltando deixaria um buraco no áudio
+        if len(split_files) != n_parts:
+            return []
+
+        return split_files
+
+    def _get_audio_duration(self, audio_path):
+        """
+        Obtém a duração do áudio usando FFprobe (com cache por arquivo)
+
+        Args:
+            audio_path (str): Caminho do arquivo de áudio
+
+        Returns:
+            float: Duração em segundos
+        """
+        try:
+            stat = os.stat(audio_path)
+            return _probe_duration(os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
 
         except Exception:
             return 0.0
@@ -265,13 +465,13 @@ class OpenCVAudioExtractor:
         """
         try:
             result = subprocess.run(['ffmpeg', '-version'],
-                                    capture_output=True, text=True)
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return result.returncode == 0
         except:
             return False
 
     def process_video_to_mp3_chunks(self, n_parts, output_dir="output",
-                                    quality="medium", cleanup=True, speed=1.0):
+                                    quality="medium", cleanup=True, speed=1.0, workers=1):
         """
         Processa vídeo completo: extrai áudio e divide em chunks MP3
 
@@ -279,7 +479,9 @@ class OpenCVAudioExtractor:
             n_parts (int): Número de partes
             output_dir (str): Diretório de saída
             quality (str): Qualidade do áudio
-            cleanup (bool): Remover arquivo de áudio temporário
+            cleanup (bool): Mantido por compatibilidade (não há mais arquivo temporário)
+            speed (float): Fator de velocidade aplicado ao áudio
+            workers (int): Número de processos FFmpeg simultâneos na extração
 
         Returns:
             dict: Resultado do processamento
@@ -292,36 +494,10 @@ class OpenCVAudioExtractor:
         if not self._check_ffmpeg():
             return {"success": False, "error": "FFmpeg não encontrado"}
 
-        # Extrair áudio
-        audio_path = self.extract_audio_to_mp3(output_dir, quality)
-        if audio_path is None:
-            return {"success": False, "error": "Falha na extração de áudio"}
-        
-        # Se speed diferente de 1, aplica aceleração/desaceleração no arquivo extraído
-        if speed != 1.0:
-            accelerated_path = accelerate_chunk(audio_path, speed=speed)
-            if accelerated_path and Path(accelerated_path).exists():
-                try:
-                    os.remove(audio_path)  # Remove original, se quiser
-                except Exception:
-                    pass
-                audio_path = accelerated_path
-            else:
-                print("Falha ao acelerar/desacelerar áudio")
-                return {"success": False, "error": "Falha ao acelerar/desacelerar áudio"}
-
-        # Dividir áudio
-        split_files = self.split_audio_chunks(audio_path, n_parts, output_dir)
+        # Extrair e dividir áudio em uma única passagem do FFmpeg
+        split_files = self.extract_audio_chunks(n_parts, output_dir, quality, speed, workers)
         if not split_files:
-            return {"success": False, "error": "Falha na divisão do áudio"}
-
-        # Limpar arquivo temporário se solicitado
-        if cleanup:
-            try:
-                os.remove(audio_path)
-                print(f"Arquivo temporário removido: {os.path.basename(audio_path)}")
-            except:
-                pass
+            return {"success": False, "error": "Falha na extração/divisão do áudio"}
 
         # Calcular tamanho total
         total_size = sum(os.path.getsize(f) for f in split_files) / (1024 * 1024)
@@ -358,57 +534,47 @@ class OpenCVAudioExtractor:
             subprocess.CompletedProcess: Resultado da execução
         """
         try:
-            # Modificar comando para mostrar progresso
-            cmd_with_progress = cmd.copy()
-            # Remover -loglevel error para capturar progresso
-            if '-loglevel' in cmd_with_progress:
-                idx = cmd_with_progress.index('-loglevel')
-                cmd_with_progress[idx + 1] = 'info'
-
-            # Executar processo
-            process = subprocess.Popen(
-                cmd_with_progress,
-                stderr=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                text=True,
-                universal_newlines=True
-            )
-
-            # Barra de progresso
-            with tqdm(total=int(duration), desc=description, unit="s") as pbar:
-                current_time = 0
-
-                while True:
-                    output = process.stderr.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-
-                    if output:
-                        # Procurar por tempo atual no output do FFmpeg
-                        if 'time=' in output:
-                            try:
-                                time_str = output.split('time=')[1].split()[0]
-                                if ':' in time_str:
-                                    # Converter HH:MM:SS.ms para segundos
-                                    time_parts = time_str.split(':')
-                                    if len(time_parts) >= 3:
-                                        hours = float(time_parts[0])
-                                        minutes = float(time_parts[1])
-                                        seconds = float(time_parts[2])
-                                        new_time = hours * 3600 + minutes * 60 + seconds
-
-                                        if new_time > current_time:
-                                            pbar.update(int(new_time - current_time))
-                                            current_time = new_time
-                            except:
-                                pass
-
-                # Completar barra se necessário
-                if current_time < duration:
-                    pbar.update(int(duration - current_time))
-
-            # Aguardar conclusão
-            stdout, stderr = process.communicate()
+            # Pedir ao FFmpeg o progresso em formato chave=valor no stdout
+            cmd_with_progress = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+
+            # Mensagens de erro vão para um arquivo temporário para não
+            # travar o pipe enquanto o stdout é lido
+            with tempfile.TemporaryFile() as stderr_file:
+                process = subprocess.Popen(
+                    cmd_with_progress,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file
+                )
+
+                # Barra de progresso
+                with tqdm(total=int(duration), desc=description, unit="s") as pbar:
+                    current_time = 0
+
+                    stdout_fd = process.stdout.fileno()
+
+                    while True:
+                        # Lê blocos brutos e só olha a última atualização de cada bloco
+                        # ("N/A" antes do primeiro frame não casa com o regex)
+                        data = os.read(stdout_fd, READ_CHUNK_SIZE)
+                        if not data:
+                            break
+
+                        matches = FFMPEG_OUT_TIME_RE.findall(data)
+                        if matches:
+                            new_time = int(matches[-1]) / 1e6
+                            if new_time > current_time:
+                                pbar.update(int(new_time) - int(current_time))
+                                current_time = new_time
+
+                    # Completar barra se necessário
+                    if current_time < duration:
+                        pbar.update(int(duration) - int(current_time))
+
+                # Aguardar conclusão
+                process.wait()
+                stderr_file.seek(0)
+                stdout = ''
+                stderr = stderr_file.read().decode(errors='replace')
 
             # Criar objeto de resultado compatível
             class Result:
@@ -427,7 +593,7 @@ class OpenCVAudioExtractor:
 
 # Função simples para uso direto
 def extract_and_split_to_mp3(video_path, n_parts, output_dir="output",
-                             quality="medium", cleanup=True, speed = 1.0):
+                             quality="medium", cleanup=True, speed = 1.0, workers=1):
     """
     Função otimizada para extrair áudio e dividir em chunks MP3
 
@@ -436,13 +602,15 @@ def extract_and_split_to_mp3(video_path, n_parts, output_dir="output",
         n_parts (int): Número de partes
         output_dir (str): Diretório de saída
         quality (str): Qualidade ('low', 'medium', 'high')
-        cleanup (bool): Remover arquivo temporário
+        cleanup (bool): Mantido por compatibilidade (não há mais arquivo temporário)
+        speed (float): Fator de velocidade aplicado ao áudio
+        workers (int): Número de processos FFmpeg simultâneos na extração
 
     Returns:
         dict: Resultado do processamento
     """
     extractor = OpenCVAudioExtractor(video_path)
-    return extractor.process_video_to_mp3_chunks(n_parts, output_dir, quality, cleanup, speed)
+    return extractor.process_video_to_mp3_chunks(n_parts, output_dir, quality, cleanup, speed, workers)
 
 
 # Exemplo de uso
@@ -453,13 +621,14 @@ if __name__ == "__main__":
     OUTPUT_DIR = "output"  # Diretório de saída
     QUALITY = "medium"  # low, medium, high
     SPEED = 2 #Velocidade do video o valor (1) e o default e não acessa a função de aceleração do audio
+    WORKERS = 1  # Processos FFmpeg em paralelo (ex.: os.cpu_count()); 1 = menor uso de recursos
 
     # Verificar arquivo
     if not os.path.exists(VIDEO_PATH):
         print(f"❌ Arquivo {VIDEO_PATH} não encontrado!")
         print("Ajuste a variável VIDEO_PATH com o caminho correto.")
     else:
-        print("🔧 Extrator de Áudio Otimizado - OpenCV + FFmpeg")
+        print("🔧 Extrator de Áudio Otimizado - FFmpeg")
         print("🎵 Formato de saída: MP3")
         print("💾 Otimizado para poucos recursos")
 
@@ -470,7 +639,8 @@ if __name__ == "__main__":
             output_dir=OUTPUT_DIR,
             quality=QUALITY,
             cleanup=True,
-            speed = SPEED
+            speed = SPEED,
+            workers = WORKERS
         )
 
         # Mostrar resultados
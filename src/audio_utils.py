@@ -1,7 +1,104 @@
+import math
+import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 
+# Qualidade VBR do libmp3lame usada ao reencodar áudio acelerado
+MP3_VBR_QUALITY = "4"
+
+
+def build_atempo_filter(speed):
+    """
+    Monta a cadeia de filtros 'atempo' válida para FFmpeg.
+
+    Cada estágio 'atempo' aceita fatores em [0.5, 2.0]. O número mínimo de
+    estágios é calculado direto (n = ceil(log2(fator))) e todos recebem o
+    mesmo fator speed ** (1/n), sem acumular arredondamentos entre estágios.
+
+    Args:
+        speed (float): Fator de velocidade (>1 acelera, <1 desacelera).
+
+    Returns:
+        str: Filtro para usar em '-filter:a' / '-af'.
+    """
+    if speed <= 0:
+        raise ValueError(f"Velocidade inválida: {speed}")
+
+    n_stages = max(1, math.ceil(math.log2(max(speed, 1 / speed)) - 1e-9))
+    stage_speed = speed ** (1 / n_stages)
+    return ",".join([f"atempo={stage_speed:.6f}"] * n_stages)
+
+
+def _speed_output_path(input_path, speed):
+    """Caminho padrão do arquivo acelerado: '<nome>_speed_<fator>.mp3' ao lado da entrada."""
+    input_path = Path(input_path)
+    return input_path.with_name(f"{input_path.stem}_speed_{speed:.2f}.mp3")
+
+
+def _is_unit_speed(speed):
+    """Indica se o fator de velocidade é 1x (nada a reencodar)."""
+    return abs(speed - 1.0) < 1e-6
+
+
+def _copy_unchanged(input_path, output_path):
+    """Copia o arquivo sem alteração; retorna o caminho de saída ou None se falhar."""
+    try:
+        shutil.copyfile(input_path, output_path)
+    except OSError as e:
+        print(f"Erro ao copiar {input_path}: {e}")
+        return None
+    return str(output_path)
+
+
+def stream_audio_for_whisper(video_path, start=None, duration=None, sample_rate=16000):
+    """
+    Decodifica o áudio do vídeo direto para memória no formato esperado pelo Whisper.
+
+    O FFmpeg escreve PCM s16le mono no stdout, sem gerar MP3 nem tocar o disco.
+    O array retornado pode ser passado direto para `model.transcribe`.
+
+    Args:
+        video_path (str): Caminho do arquivo de vídeo.
+        start (float): Início do trecho em segundos (None = início do arquivo).
+        duration (float): Duração do trecho em segundos (None = até o fim).
+        sample_rate (int): Taxa de amostragem de saída (Whisper usa 16000).
+
+    Returns:
+        numpy.ndarray: Áudio float32 normalizado em [-1, 1] ou None se falhar.
+    """
+    cmd = ["ffmpeg", "-nostdin"]
+    if start is not None:
+        cmd += ["-ss", str(start)]  # Antes do -i para seek rápido na entrada
+    if duration is not None:
+        cmd += ["-t", str(duration)]
+    cmd += [
+        "-i", str(video_path),
+        "-vn",
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-loglevel", "error",
+        "-"
+    ]
+
+    # Import local: main.py importa este módulo e não precisa do numpy
+    import numpy as np
+
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               bufsize=1 << 20)
+    raw, stderr = process.communicate()
+
+    if process.returncode != 0:
+        print(f"Erro FFmpeg: {stderr.decode(errors='replace')}")
+        return None
+
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+
 def accelerate_chunk(input_path, speed=1.5):
     """
     Acelera um arquivo de áudio MP3 usando FFmpeg com filtro 'atempo'.
@@ -17,31 +114,121 @@ def accelerate_chunk(input_path, speed=1.5):
     start = time.perf_counter()
 
     input_path = Path(input_path)
-    output_path = input_path.with_name(f"{input_path.stem}_speed_{speed:.2f}.mp3")
-
-    # Gerar filtros atempo válidos para FFmpeg
-    tempo_filters = []
-    remaining_speed = speed
-    while remaining_speed > 2.0:
-        tempo_filters.append("atempo=2.0")
-        remaining_speed /= 2.0
-    while remaining_speed < 0.5:
-        tempo_filters.append("atempo=0.5")
-        remaining_speed /= 0.5
-    tempo_filters.append(f"atempo={remaining_speed:.2f}")
-    filter_str = ",".join(tempo_filters)
+    output_path = _speed_output_path(input_path, speed)
+
+    # Velocidade 1x: basta copiar o arquivo, sem passar pelo FFmpeg
+    if _is_unit_speed(speed):
+        return _copy_unchanged(input_path, output_path)
+
+    filter_str = build_atempo_filter(speed)
 
     cmd = [
         "ffmpeg", "-y", "-i", str(input_path),
         "-filter:a", filter_str,
         "-vn",
+        "-c:a", "libmp3lame",
+        "-q:a", MP3_VBR_QUALITY,  # VBR: mais rápido que CBR com qualidade equivalente
+        "-loglevel", "error",
         str(output_path)
     ]
 
-    
-    result = subprocess.run(cmd, capture_output=True)
+    # Só o stderr é capturado, e decodificado apenas em caso de erro
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     duration = time.perf_counter() - start
 
+    if result.returncode != 0:
+        print(f"Erro FFmpeg: {result.stderr.decode(errors='replace')}")
+        return None
+
     print(f"⏱️ Tempo para acelerar o áudio ({speed:.2f}x): {duration:.2f} segundos")
 
     return str(output_path) if output_path.exists() else None
+
+
+def accelerate_chunks(input_paths, speed=1.5, workers=None):
+    """
+    Acelera vários arquivos MP3 em paralelo, com um processo FFmpeg por arquivo.
+
+    Cada FFmpeg usa uma única thread no libmp3lame, então rodar vários
+    processos ao mesmo tempo escala até o número de núcleos. Threads bastam
+    aqui porque o trabalho pesado acontece no subprocesso.
+
+    Args:
+        input_paths (list): Caminhos dos arquivos MP3 de entrada.
+        speed (float): Fator de velocidade (>1 acelera, <1 desacelera).
+        workers (int): Número máximo de processos simultâneos (padrão: núcleos da CPU).
+
+    Returns:
+        list: Caminhos dos arquivos acelerados (None para os que falharem), na mesma ordem da entrada.
+    """
+    input_paths = list(input_paths)
+    if not input_paths:
+        return []
+
+    max_workers = min(len(input_paths), workers or os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: accelerate_chunk(path, speed=speed), input_paths))
+
+
+def accelerate_chunks_batch(jobs):
+    """
+    Acelera vários arquivos em uma única execução do FFmpeg.
+
+    Monta um único filter_complex com uma cadeia 'atempo' por entrada e um
+    '-map' por saída, pagando a inicialização do FFmpeg e do libmp3lame uma
+    só vez para todo o lote.
+
+    Args:
+        jobs (list): Tuplas (input_path, output_path, speed). Se output_path
+            for None, usa o mesmo nome gerado por accelerate_chunk.
+
+    Returns:
+        list: Caminhos dos arquivos gerados (None para os que não existirem), na ordem dos jobs.
+    """
+    if not jobs:
+        return []
+
+    start = time.perf_counter()
+
+    cmd = ["ffmpeg", "-y"]
+    filters = []
+    output_args = []
+    output_paths = []
+
+    results = [None] * len(jobs)
+
+    for job_index, (input_path, output_path, speed) in enumerate(jobs):
+        output_path = Path(output_path) if output_path else _speed_output_path(input_path, speed)
+
+        # Velocidade 1x: cópia direta, fora do FFmpeg (mesma regra de accelerate_chunk)
+        if _is_unit_speed(speed):
+            results[job_index] = _copy_unchanged(input_path, output_path)
+            continue
+
+        i = len(output_paths)
+        output_paths.append((job_index, output_path))
+
+        cmd += ["-i", str(input_path)]
+        filters.append(f"[{i}:a]{build_atempo_filter(speed)}[a{i}]")
+        output_args += ["-map", f"[a{i}]", "-c:a", "libmp3lame", "-q:a", MP3_VBR_QUALITY,
+                        str(output_path)]
+
+    if not output_paths:
+        return results
+
+    cmd += ["-filter_complex", ";".join(filters), "-loglevel", "error"] + output_args
+
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    duration = time.perf_counter() - start
+
+    if result.returncode != 0:
+        print(f"Erro FFmpeg: {result.stderr.decode(errors='replace')}")
+        return results
+
+    print(f"⏱️ Tempo para acelerar {len(output_paths)} áudios em lote: {duration:.2f} segundos")
+
+    for job_index, path in output_paths:
+        results[job_index] = str(path) if path.exists() else None
+
+    return results
@@ -1,48 +1,110 @@
 import os
 import time
-import whisper
-import difflib
-from jiwer import wer
-from pathlib import Path
+import multiprocessing
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+from whisper_dispositivo import escolher_dispositivo
 
 
 # Pasta com os arquivos .mp3 acelerados e seus .txt
 PASTA = r"\extract_audio_from_video\output"
 
-# Carrega o modelo Whisper (opções: tiny, base, small, medium, large)
-model = whisper.load_model("base")
+# Modelo Whisper (opções: tiny, base, small, medium, large)
+MODELO = "base"
+
+# Janelas de 30 s processadas por passagem do encoder
+BATCH_SIZE = 16
+
+# Pasta do modelo exportado para ONNX (ver whisper_onnx.py). Se definida, usa
+# o ONNX Runtime na CPU em vez do faster-whisper
+MODELO_ONNX = None
+
+# Usa GPU se houver CUDA; senão CPU, com o menor tipo de computação suportado
+DEVICE, COMPUTE_TYPE = escolher_dispositivo()
+USA_GPU = DEVICE == "cuda"
+
+# Modelo carregado uma vez por processo
+_model = None
+_cpu_threads = 0
+
+
+def _get_model():
+    global _model
+    if _model is None:
+        if MODELO_ONNX:
+            from whisper_onnx import carregar_transcritor_onnx
+            _model = carregar_transcritor_onnx(MODELO_ONNX, idioma="portuguese",
+                                               threads=_cpu_threads)
+            return _model
 
-# Coletar arquivos .mp3 com tag de velocidade
-arquivos = sorted([f for f in os.listdir(PASTA) if f.endswith(".mp3") and "speed" in f])
+        model = WhisperModel(MODELO, device=DEVICE, compute_type=COMPUTE_TYPE,
+                             cpu_threads=_cpu_threads)
+        # Agrupa as janelas de áudio (segmentadas por VAD) em lotes no encoder
+        _model = BatchedInferencePipeline(model=model)
+    return _model
 
-# Resultados acumulados
-resultados = []
 
-for mp3_file in arquivos:
+def _init_worker(threads):
+    # Divide os núcleos entre os processos para não competirem entre si
+    global _cpu_threads
+    _cpu_threads = threads
+    # Carrega o modelo já na inicialização, fora da medição de tempo
+    _get_model()
+
+
+def transcrever_arquivo(mp3_file):
     caminho_mp3 = os.path.join(PASTA, mp3_file)
-    velocidade = mp3_file.split("_speed_")[1].split("_")[0]  # extrai "1.25" de "example_speed_1.25_parte_001.mp3"
+    velocidade = mp3_file.partition("_speed_")[2].partition("_")[0]  # extrai "1.25" de "example_speed_1.25_parte_001.mp3"
 
     print(f"\n🎧 Transcrevendo {mp3_file} (Velocidade: {velocidade}x)...")
 
+    # Carrega o modelo (se ainda não carregado) fora da medição de tempo
+    model = _get_model()
+
     # Tempo de execução
     inicio = time.time()
-    resultado = model.transcribe(caminho_mp3, language="pt")
+    if MODELO_ONNX:
+        texto_obtido = model(caminho_mp3)
+    else:
+        segments, _ = model.transcribe(caminho_mp3, language="pt", batch_size=BATCH_SIZE)
+        # Os segmentos são gerados sob demanda: a transcrição acontece aqui
+        texto_obtido = " ".join(s.text.strip() for s in segments)
     fim = time.time()
     tempo_exec = fim - inicio
 
-    # Texto gerado
-    texto_obtido = resultado["text"].strip()
-
-    resultados.append({
+    return {
         "velocidade": velocidade,
         "tempo": tempo_exec,
         "texto": texto_obtido
-    })
+    }
+
+
+if __name__ == "__main__":
+    if MODELO_ONNX:
+        print(f"Backend: ONNX Runtime ({MODELO_ONNX})")
+    else:
+        print(f"Dispositivo: {DEVICE} ({COMPUTE_TYPE})")
+
+    # Coletar arquivos .mp3 com tag de velocidade
+    with os.scandir(PASTA) as it:
+        arquivos = sorted(e.name for e in it
+                          if e.name.endswith(".mp3") and "speed" in e.name and e.is_file())
 
-# Exibir resultado
-print("\n====================== BENCHMARK ======================")
-print(f"{'Velocidade':<12} {'Tempo (s)':<10} Transcrição")
-print("-" * 60)
-for r in resultados:
-    print(f"{r['velocidade']:<12} {r['tempo']:<10.2f} {r['texto'][:90]}")
+    if USA_GPU and not MODELO_ONNX:
+        # Na GPU, vários processos só disputariam o mesmo dispositivo
+        _get_model()
+        resultados = [transcrever_arquivo(f) for f in arquivos]
+    else:
+        # Na CPU, transcreve vários arquivos em paralelo (um modelo por processo)
+        n_cpus = os.cpu_count() or 1
+        n_procs = max(1, min(len(arquivos), n_cpus))
+        with multiprocessing.Pool(processes=n_procs, initializer=_init_worker,
+                                  initargs=(max(1, n_cpus // n_procs),)) as pool:
+            resultados = pool.map(transcrever_arquivo, arquivos)
 
+    # Exibir resultado
+    print("\n====================== BENCHMARK ======================")
+    print(f"{'Velocidade':<12} {'Tempo (s)':<10} Transcrição")
+    print("-" * 60)
+    for r in resultados:
+        print(f"{r['velocidade']:<12} {r['tempo']:<10.2f} {r['texto'][:90]}")
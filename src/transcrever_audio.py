@@ -3,18 +3,31 @@ Script para transcrever um arquivo de áudio MP3 usando o modelo Whisper.
 
 Este script carrega um modelo Whisper pré-treinado, transcreve o conteúdo
 de um arquivo de áudio e salva o texto em um arquivo `.txt` correspondente.
+Se o caminho for um vídeo, o áudio é decodificado direto para memória
+(sem gerar MP3) e entregue ao modelo.
 
 Requisitos:
-- whisper
+- faster-whisper
+- optimum[onnxruntime] (opcional, para o backend ONNX; ver whisper_onnx.py)
 
 Autor: Gilson Almeida (https://github.com/gilsonfiho)
 Data: 2025-07-05
 """
 
-import whisper
+from faster_whisper import WhisperModel
 import os
 import sys
 
+from audio_utils import stream_audio_for_whisper
+from whisper_dispositivo import escolher_dispositivo
+
+# Extensões tratadas como vídeo (áudio lido direto do FFmpeg para memória)
+EXTENSOES_VIDEO = {".mp4", ".mkv", ".avi", ".mov", ".flv", ".wmv", ".3gp"}
+
+# Pasta do modelo exportado para ONNX (ver whisper_onnx.py). Se definida, usa
+# o ONNX Runtime na CPU em vez do faster-whisper
+MODELO_ONNX = None
+
 def transcrever():
     """
     Executa o processo de transcrição de um arquivo MP3 usando o Whisper.
@@ -41,16 +54,34 @@ def transcrever():
     # Define o nome do arquivo de saída com extensão .txt
     output_text = os.path.splitext(audio_path)[0] + ".txt"
 
+    # Vídeo: PCM 16 kHz em memória, sem passar por MP3 nem pelo disco
+    audio = audio_path
+    if os.path.splitext(audio_path)[1].lower() in EXTENSOES_VIDEO:
+        print("Decodificando áudio do vídeo...")
+        audio = stream_audio_for_whisper(audio_path)
+        if audio is None:
+            sys.exit(1)
+
     # Carrega o modelo Whisper (opções: tiny, base, small, medium, large)
     print("Carregando modelo Whisper...")
-    model = whisper.load_model("base")
-
-    # Realiza a transcrição do áudio
-    print("Transcrevendo áudio...")
-    result = model.transcribe(audio_path)
-
-    # Extrai o texto da transcrição
-    transcription = result["text"]
+    if MODELO_ONNX:
+        from whisper_onnx import carregar_transcritor_onnx
+        transcrever_onnx = carregar_transcritor_onnx(MODELO_ONNX)
+
+        print("Transcrevendo áudio...")
+        transcription = transcrever_onnx(audio)
+    else:
+        # CTranslate2 com pesos quantizados em int8 (int8_float16 na GPU); FP32 só
+        # se o hardware não suportar tipos menores
+        device, compute_type = escolher_dispositivo()
+        model = WhisperModel("base", device=device, compute_type=compute_type)
+
+        # Realiza a transcrição do áudio
+        print("Transcrevendo áudio...")
+        segments, _ = model.transcribe(audio)
+
+        # Extrai o texto da transcrição
+        transcription = " ".join(s.text.strip() for s in segments)
 
     # Salva o texto em um arquivo .txt
     with open(output_text, "w", encoding="utf-8") as f:
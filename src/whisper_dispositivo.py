@@ -0,0 +1,27 @@
+"""
+Escolha do dispositivo e do tipo de computação do Whisper (faster-whisper / CTranslate2).
+
+Usado pelos scripts de transcrição para que todos sigam a mesma preferência.
+"""
+
+import ctranslate2
+
+# Tipos de computação em ordem de preferência: pesos int8 primeiro (4x menos
+# bytes que FP32), depois meia precisão, e FP32 só como último recurso
+PREFERENCIA_COMPUTE = {
+    "cuda": ["int8_float16", "float16", "int8"],
+    "cpu": ["int8", "float16"],
+}
+
+
+def escolher_dispositivo():
+    """
+    Escolhe o dispositivo (GPU se houver CUDA) e o menor tipo de computação suportado nele.
+
+    Returns:
+        tuple: (device, compute_type), ex.: ("cpu", "int8").
+    """
+    device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    suportados = ctranslate2.get_supported_compute_types(device)
+    compute_type = next((c for c in PREFERENCIA_COMPUTE[device] if c in suportados), "float32")
+    return device, compute_type
@@ -0,0 +1,68 @@
+"""
+Backend opcional para rodar o Whisper com ONNX Runtime (CPU) e pesos int8.
+
+O modelo precisa ser exportado e quantizado antes, com o `optimum`:
+
+    optimum-cli export onnx --model openai/whisper-base --task automatic-speech-recognition whisper_onnx/
+    optimum-cli onnxruntime quantize --avx512_vnni --onnx_model whisper_onnx/ -o whisper_onnx_int8/
+
+A quantização não copia o tokenizer, o feature extractor nem o
+generation_config.json; eles são carregados de `pasta_processor` (a exportação
+sem quantizar ou o modelo original no Hugging Face Hub).
+
+Requisitos (opcionais, não estão no requirements.txt):
+- optimum[onnxruntime]
+"""
+
+
+def carregar_transcritor_onnx(pasta_modelo, idioma=None, threads=0,
+                              pasta_processor="openai/whisper-base"):
+    """
+    Carrega um modelo Whisper exportado para ONNX e devolve uma função de transcrição.
+
+    Args:
+        pasta_modelo (str): Pasta com o modelo ONNX (quantizado) exportado pelo optimum.
+        idioma (str): Idioma passado ao `generate` do Whisper (None = detecção automática).
+        threads (int): Threads do ONNX Runtime por operação (0 = padrão do ORT).
+        pasta_processor (str): Pasta ou id do Hub com tokenizer, feature extractor
+            e configuração de geração (mapas de idioma/tarefa do Whisper).
+
+    Returns:
+        callable: Função `transcrever(caminho_audio) -> str`.
+    """
+    # Imports locais: só são necessários quando o backend ONNX é usado
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import AutoProcessor, GenerationConfig, pipeline
+
+    session_options = ort.SessionOptions()
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session_options.intra_op_num_threads = threads
+
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(
+        pasta_modelo,
+        provider="CPUExecutionProvider",
+        session_options=session_options,
+    )
+    processor = AutoProcessor.from_pretrained(pasta_processor)
+    # Sem isso o generate não conhece task_to_id/lang_to_id e falha com
+    # "task"/"language" nos generate_kwargs
+    model.generation_config = GenerationConfig.from_pretrained(pasta_processor)
+
+    generate_kwargs = {"task": "transcribe"}
+    if idioma:
+        generate_kwargs["language"] = idioma
+
+    asr = pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+        chunk_length_s=30,  # Áudios longos em janelas de 30 s, como o Whisper
+        generate_kwargs=generate_kwargs,
+    )
+
+    def transcrever(caminho_audio):
+        return asr(caminho_audio)["text"].strip()
+
+    return transcrever